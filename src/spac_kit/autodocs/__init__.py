@@ -1,20 +1,61 @@
-import importlib.metadata
+import functools
+import hashlib
+import html
+import importlib
+import itertools
+import json
+import logging
+import operator
 import os
 import shutil
-from collections import defaultdict
+import sys
 from collections import namedtuple
 
-from ccsdspy.packet_types import _BasePacket
-from docutils import nodes
-from sphinx import addnodes
-from sphinx.directives import ObjectDescription
-from sphinx.util import logging
+# Sphinx, docutils and ccsdspy are imported inside the functions that use them
+# (for the directive, once when its class is built) so that importing this
+# module (e.g. while Sphinx discovers extensions) stays cheap. Log through the stdlib logger in Sphinx's namespace so records still
+# reach Sphinx's handlers.
+logger = logging.getLogger(f"sphinx.{__name__}")
 
-logger = logging.getLogger(__name__)
+
+def __getattr__(name):
+    # Module-level __getattr__ (PEP 562) defers building the directive class
+    if name == "SpacDocsDirective":
+        return _get_directive_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_directive_class():
+    """Build the ``spacdocs`` directive class on first use and cache it."""
+    directive_class = globals().get("SpacDocsDirective")
+    if directive_class is None:
+        from docutils import nodes
+        from sphinx import addnodes
+        from sphinx.directives import ObjectDescription
+
+        class SpacDocsDirective(_SpacDocsDirectiveMixin, ObjectDescription):
+            __qualname__ = "SpacDocsDirective"
+            _nodes = nodes
+            _addnodes = addnodes
+
+        directive_class = globals()["SpacDocsDirective"] = SpacDocsDirective
+    return directive_class
+
+
+@functools.lru_cache(maxsize=None)
+def _version():
+    """Return the installed spac_kit version, read from its metadata only once."""
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("spac_kit")
+    except importlib.metadata.PackageNotFoundError:
+        # Running from a source tree that was never installed
+        return "unknown version"
 
 
 def setup(app):
-    app.add_directive("spacdocs", SpacDocsDirective)
+    app.add_directive("spacdocs", _get_directive_class())
     app.add_config_value("spacdocs_packet_modules", [], "env")
     app.add_css_file("spac-kit.css")
 
@@ -22,23 +63,177 @@ def setup(app):
     app.connect("config-inited", copy_static_css)
 
     return {
-        "version": importlib.metadata.version("spac_kit"),
+        "version": _version(),
         "parallel_read_safe": True,
         "parallel_write_safe": True,
     }
 
 
+def _temp_path(path):
+    """Return a per-process temporary path next to ``path``."""
+    return f"{path}.tmp-{os.getpid()}"
+
+
+def _atomic_write(path, data):
+    """Write bytes to ``path`` through a temporary file and ``os.replace``.
+
+    Concurrent readers, such as parallel Sphinx workers, see either the old or
+    the new file but never a partially written one.
+    """
+    tmp_path = _temp_path(path)
+    try:
+        # A buffered file keeps writing until all of ``data`` is out, where a
+        # single os.write() may stop short
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _discard_temp(tmp_path)
+        raise
+
+
+def _discard_temp(tmp_path):
+    """Remove a temporary file left by a failed write, if there is one."""
+    try:
+        os.unlink(tmp_path)
+    except OSError:
+        pass
+
+
 # --- Stub generation for packets ---
+def _encode_and_digest(content):
+    """Encode generated text once, returning the bytes and their short hex digest.
+
+    The same bytes are then used both for the fingerprint comparison and for
+    the write, so the text is never transcoded twice.
+    """
+    data = content.encode()
+    return data, hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _load_fingerprints(path):
+    """Load the stub fingerprint index, returning an empty index if unreadable."""
+    try:
+        with open(path, "r") as f:
+            fingerprints = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return fingerprints if isinstance(fingerprints, dict) else {}
+
+
+def _save_fingerprints(path, fingerprints):
+    """Atomically replace the stub fingerprint index."""
+    _atomic_write(path, json.dumps(fingerprints, indent=2, sort_keys=True).encode())
+
+
+def _write_if_changed(path, data, digest, known_digest):
+    """Write the bytes ``data`` to ``path`` unless the file already holds them.
+
+    A matching entry in the fingerprint index is trusted as long as the file
+    still exists. Without a recorded fingerprint the file is compared by size
+    and then by a single read. Changed files are written with a single write
+    to a temporary file that then atomically replaces ``path``.
+    Returns True if the file was written.
+    """
+    if known_digest == digest:
+        if os.path.exists(path):
+            return False
+    elif known_digest is None:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            pass
+        else:
+            try:
+                size = os.fstat(fd).st_size
+                if size == len(data) and os.read(fd, size) == data:
+                    return False
+            finally:
+                os.close(fd)
+
+    _atomic_write(path, data)
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _rule(char, length):
+    """Return an RST heading underline, reused across headings of equal length."""
+    return char * length
+
+
+def _package_sources(modpath):
+    """Return ``{source file: mtime}`` for a loaded module and its package.
+
+    Packets may be re-exported from other modules of the same top-level
+    package (``from pk.defs import *``), so every loaded module of that package
+    is included. Re-exports from other top-level packages are not tracked.
+    Returns None if the module itself has no source file.
+    """
+    if getattr(sys.modules.get(modpath), "__file__", None) is None:
+        return None
+    top = modpath.partition(".")[0]
+    sources = {}
+    for name, module in list(sys.modules.items()):
+        if name != top and not name.startswith(f"{top}."):
+            continue
+        source = getattr(module, "__file__", None)
+        if source is None:
+            continue
+        try:
+            sources[source] = os.stat(source).st_mtime_ns
+        except OSError:
+            return None
+    return sources
+
+
+def _sources_unchanged(sources):
+    """Return True if every file in ``{source file: mtime}`` still has that mtime."""
+    try:
+        return all(
+            os.stat(source).st_mtime_ns == mtime for source, mtime in sources.items()
+        )
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_import(module_name):
+    """Import a module, answering repeat requests from ``sys.modules`` or a memo."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
+
+def _safe_import(modpath):
+    """Import a module, returning ``(modpath, module)`` or ``(modpath, exception)``."""
+    logger.info("[spacdocs] Importing module: %s", modpath)
+    try:
+        return modpath, _cached_import(modpath)
+    except Exception as e:
+        return modpath, e
+
+
+def _import_serially(modpaths):
+    """Import modules one after the other, see ``_safe_import``."""
+    return [_safe_import(modpath) for modpath in modpaths]
+
+
 def generate_packet_stubs(app):
     """
     Scan for all _BasePacket instances in a configured module, generate .rst stubs for each,
     and update a master toctree file.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ccsdspy.packet_types import _BasePacket
+
     # --- Configuration ---
     # You may want to make this configurable via conf.py
     PACKET_MODULES = getattr(app.config, "spacdocs_packet_modules", [])
     STUB_DIR = os.path.join(app.srcdir, "_autopackets")
     TOCTREE_FILE = os.path.join(app.srcdir, "_packet_index.rst")
+    FINGERPRINT_FILE = os.path.join(STUB_DIR, ".fingerprints.json")
 
     logger.info("[spacdocs] generate_packet_stubs running, srcdir=%s", app.srcdir)
     logger.info("[spacdocs] PACKET_MODULES: %s", PACKET_MODULES)
@@ -49,59 +244,154 @@ def generate_packet_stubs(app):
         return
 
     os.makedirs(STUB_DIR, exist_ok=True)
+    # Index from the previous build; rebuilt each run so stale entries drop out
+    old_fingerprints = _load_fingerprints(FINGERPRINT_FILE)
+    # Stubs written by another spac_kit version may differ in format, so the
+    # version is recorded along with the configured modules
+    _, modules_digest = _encode_and_digest("\n".join([_version(), *PACKET_MODULES]))
+    fingerprints = {}
     stub_infos = []  # List of dicts: {module_path, packet_name, stub_relpath}
+    written = []  # Names of the stubs that were (re)written
+
+    # Packet names found per module, kept in the build environment (which
+    # Sphinx pickles between runs) together with the mtimes of the package
+    # sources they were found in, so only modules whose package changed need
+    # importing again. The mtimes are machine-specific, so they are kept out of
+    # the index, which projects may commit along with the stubs
+    env = getattr(app, "env", None)
+    cache = getattr(env, "spacdocs_cache", None)
+    if not isinstance(cache, dict):
+        cache = {}
+        if env is not None:
+            env.spacdocs_cache = cache
+
+    packet_names = {}  # module path -> names of the packets it defines
+    to_import = []
+    for modpath in PACKET_MODULES:
+        cached = cache.get(modpath)
+        if cached is not None and _sources_unchanged(cached[0]):
+            packet_names[modpath] = cached[1]
+        else:
+            to_import.append(modpath)
+
+    # Stub content only depends on the configured modules and the packet names
+    # they define, so nothing can have changed if the same modules are
+    # configured, all of them were found in unchanged sources, and every file
+    # the last index lists is still there
+    old_outputs = [TOCTREE_FILE] + [
+        os.path.join(STUB_DIR, name)
+        for name in old_fingerprints
+        if name.endswith(".rst")
+    ]
+    if (
+        not to_import
+        and old_fingerprints.get("_modules") == modules_digest
+        and all(os.path.exists(path) for path in old_outputs)
+    ):
+        logger.info(
+            "[spacdocs] All packet sources unchanged, skipping stub generation."
+        )
+        return
+
+    # A module imported before this run (e.g. by an earlier in-process build)
+    # may predate edits to its sources, so its names are used but not cached
+    preloaded = {modpath for modpath in to_import if modpath in sys.modules}
+
+    results = []
+    if to_import:
+        # Imports are mostly spent reading and compiling files, so run them
+        # concurrently. Modules of one top-level package may import each other,
+        # which across threads can hand one a partially initialised module, so
+        # each package is imported serially by a single worker
+        packages = {}  # top-level package -> its modules to import
+        for modpath in to_import:
+            packages.setdefault(modpath.partition(".")[0], []).append(modpath)
+        if len(packages) == 1:
+            # Nothing to overlap, so import on this thread
+            imported = dict(_import_serially(to_import))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+                imported = dict(
+                    itertools.chain.from_iterable(
+                        executor.map(_import_serially, packages.values())
+                    )
+                )
+        # Process the results serially, in config order
+        results = [(modpath, imported[modpath]) for modpath in to_import]
+
+    # Module attributes share a handful of types (functions, classes, other
+    # modules...), so the isinstance() outcome is remembered per type
+    is_packet_type = {}
+    for modpath, module in results:
+        if isinstance(module, Exception):
+            logger.error("[spacdocs] Failed to import %s: %s", modpath, module)
+            continue
+        names = []
+        # Walk the module namespace directly rather than dir() plus a getattr()
+        # per name, sorted by name like dir() so the toctree order is stable
+        for attr_name, attr in sorted(module.__dict__.items()):
+            if attr_name.startswith("_"):
+                continue
+            attr_type = type(attr)
+            is_packet = is_packet_type.get(attr_type)
+            if is_packet is None:
+                is_packet = is_packet_type[attr_type] = isinstance(attr, _BasePacket)
+            if is_packet:
+                names.append(attr_name)
+        packet_names[modpath] = names
+        # A module that is no longer registered failed to finish importing,
+        # so what was scanned may be incomplete and is not cached
+        if modpath not in preloaded and sys.modules.get(modpath) is module:
+            sources = _package_sources(modpath)
+            if sources is not None:
+                cache[modpath] = (sources, names)
+
+    # A failed import leaves stubs missing, so only a complete run may be
+    # skipped next time
+    if len(packet_names) == len(PACKET_MODULES):
+        fingerprints["_modules"] = modules_digest
 
     for modpath in PACKET_MODULES:
-        logger.info("[spacdocs] Importing module: %s", modpath)
-        try:
-            module = importlib.import_module(modpath)
-        except Exception as e:
-            logger.error("[spacdocs] Failed to import %s: %s", modpath, e)
+        if modpath not in packet_names:
             continue
-        found_packet = False
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if isinstance(attr, _BasePacket):
-                found_packet = True
-                full_var_path = f"{modpath}.{attr_name}"
-                modpath_parts = modpath.split(".")
-                last_modpart = modpath_parts[-1] if modpath_parts else ""
-
-                # Avoid repeating the last module part if attr_name matches
-                if attr_name == last_modpart:
-                    stub_name = f"{modpath.replace('.', '_')}.rst"
-                else:
-                    stub_name = f"{modpath.replace('.', '_')}_{attr_name}.rst"
-                stub_path = os.path.join(STUB_DIR, stub_name)
-
-                # No toctree for fields; field listing is handled by the directive
-                stub_content = f"{attr_name}\n{'='*len(attr_name)}\n\n.. spacdocs:: {full_var_path}\n\n"
-                write_stub = True
-                if os.path.exists(stub_path):
-                    with open(stub_path, "r") as f:
-                        existing = f.read()
-                    if existing == stub_content:
-                        write_stub = False
-                if write_stub:
-                    logger.info("[spacdocs] Writing stub: %s", stub_path)
-                    with open(stub_path, "w") as f:
-                        f.write(stub_content)
-                stub_relpath = f"_autopackets/{stub_name}"
-                stub_infos.append(
-                    {
-                        "module_path": modpath,
-                        "packet_name": attr_name,
-                        "stub_relpath": stub_relpath,
-                    }
-                )
-        if not found_packet:
+        if not packet_names[modpath]:
             logger.warning("[spacdocs] No _BasePacket instances found in %s", modpath)
+        modpath_parts = modpath.split(".")
+        last_modpart = modpath_parts[-1] if modpath_parts else ""
+        for attr_name in packet_names[modpath]:
+            full_var_path = f"{modpath}.{attr_name}"
+
+            # Avoid repeating the last module part if attr_name matches
+            if attr_name == last_modpart:
+                stub_name = f"{modpath.replace('.', '_')}.rst"
+            else:
+                stub_name = f"{modpath.replace('.', '_')}_{attr_name}.rst"
+            stub_path = os.path.join(STUB_DIR, stub_name)
+
+            # No toctree for fields; field listing is handled by the directive
+            stub_content = f"{attr_name}\n{_rule('=', len(attr_name))}\n\n.. spacdocs:: {full_var_path}\n\n"
+            stub_data, digest = _encode_and_digest(stub_content)
+            fingerprints[stub_name] = digest
+            if _write_if_changed(
+                stub_path, stub_data, digest, old_fingerprints.get(stub_name)
+            ):
+                logger.debug("[spacdocs] Wrote stub: %s", stub_path)
+                written.append(stub_name)
+            stub_relpath = f"_autopackets/{stub_name}"
+            stub_infos.append(
+                {
+                    "module_path": modpath,
+                    "packet_name": attr_name,
+                    "stub_relpath": stub_relpath,
+                }
+            )
 
     # Group stubs by parent module, child module, then packets
     # Build a 3-level hierarchy: parent module, child module, packet
     # parent = first N-1 parts, child = last part, packet = packet name
     # We'll use the module_path for parent/child splitting
-    parent_to_child = defaultdict(lambda: defaultdict(list))
+    groups = {}  # (parent module, child module) -> packets
+    parent_order = {}  # parent module -> position of its first appearance
     for info in stub_infos:
         mod_parts = info["module_path"].split(".")
         if len(mod_parts) < 2:
@@ -110,35 +400,106 @@ def generate_packet_stubs(app):
         else:
             parent_mod = ".".join(mod_parts[:-1])
             child_mod = mod_parts[-1]
-        parent_to_child[parent_mod][child_mod].append(
+        groups.setdefault((parent_mod, child_mod), []).append(
             (info["packet_name"], info["stub_relpath"])
         )
-
-    toctree_content = ""
-    for parent_mod, child_dict in parent_to_child.items():
-        toctree_content += f"{parent_mod}\n{'='*len(parent_mod)}\n\n"
-        for child_mod, packets in child_dict.items():
-            child_header = child_mod if child_mod else "packets"
-            toctree_content += f"{child_header}\n{'-'*len(child_header)}\n\n.. toctree::\n   :maxdepth: 2\n\n"
-            for packet_name, stub in packets:
-                toctree_content += f"   {stub}\n"
-            toctree_content += "\n"
-        toctree_content += "\n"
-
-    write_toctree = True
-    if os.path.exists(TOCTREE_FILE):
-        with open(TOCTREE_FILE, "r") as f:
-            existing = f.read()
-        if existing == toctree_content:
-            write_toctree = False
-    if write_toctree:
-        logger.info("[spacdocs] Writing toctree file: %s", TOCTREE_FILE)
-        with open(TOCTREE_FILE, "w") as f:
-            f.write(toctree_content)
-    logger.info("[spacdocs] Stub files written: %d", len(stub_infos))
+        parent_order.setdefault(parent_mod, len(parent_order))
+
+    # Collect the pieces and join once, rather than growing a string with +=.
+    # The stable sort brings each parent's children together without changing
+    # their order, so a parent header is emitted whenever the parent changes.
+    toctree_parts = []
+    last_parent = None
+    for (parent_mod, child_mod), packets in sorted(
+        groups.items(), key=lambda item: parent_order[item[0][0]]
+    ):
+        if parent_mod != last_parent:
+            if last_parent is not None:
+                toctree_parts.append("\n")
+            toctree_parts.append(f"{parent_mod}\n{_rule('=', len(parent_mod))}\n\n")
+            last_parent = parent_mod
+        child_header = child_mod if child_mod else "packets"
+        toctree_parts.append(
+            f"{child_header}\n{_rule('-', len(child_header))}\n\n.. toctree::\n   :maxdepth: 2\n\n"
+        )
+        for packet_name, stub in packets:
+            toctree_parts.append(f"   {stub}\n")
+        toctree_parts.append("\n")
+    if last_parent is not None:
+        toctree_parts.append("\n")
+
+    toctree_data, digest = _encode_and_digest("".join(toctree_parts))
+    fingerprints["_toctree"] = digest
+    if _write_if_changed(
+        TOCTREE_FILE, toctree_data, digest, old_fingerprints.get("_toctree")
+    ):
+        logger.info("[spacdocs] Wrote toctree file: %s", TOCTREE_FILE)
+    _save_fingerprints(FINGERPRINT_FILE, fingerprints)
+    # One summary record instead of one per stub
+    logger.info(
+        "[spacdocs] Wrote %d/%d stubs: %s",
+        len(written),
+        len(stub_infos),
+        ", ".join(written[:10]) + ("..." if len(written) > 10 else ""),
+    )
     logger.info("[spacdocs] Done with stub generation.")
 
 
+# --- Static resources ---
+_CHUNK_SIZE = 64 * 1024
+
+
+def _same_contents(path1, path2):
+    """Return True if two files of equal size hold the same bytes.
+
+    Both files are read in fixed-size chunks and compared as they go, so
+    neither is held in memory in full and the first difference ends the read.
+    """
+    with open(path1, "rb") as f1, open(path2, "rb") as f2:
+        for chunk in iter(lambda: f1.read(_CHUNK_SIZE), b""):
+            if chunk != f2.read(_CHUNK_SIZE):
+                return False
+    return True
+
+
+def _list_files(dirpath):
+    """Map the names of the regular files in ``dirpath`` to their ``DirEntry``.
+
+    scandir reports the file type from the directory listing itself and each
+    entry caches its stat() result, so callers can check sizes without extra
+    syscalls per file.
+    """
+    with os.scandir(dirpath) as it:
+        return {entry.name: entry for entry in it if entry.is_file()}
+
+
+def _copy_if_changed(src, dest_path, dest=None):
+    """Copy the file behind ``src`` to ``dest_path`` unless it is already there.
+
+    ``src`` and ``dest`` are ``os.DirEntry`` objects, ``dest`` being None when
+    ``dest_path`` does not exist. Returns True if the file was copied.
+    """
+    src_stat = src.stat()
+    # Copies carry the source mtime, so a matching size and mtime means
+    # the file is still the one we copied and its contents need no reading
+    if dest is not None and dest.stat().st_size == src_stat.st_size:
+        if dest.stat().st_mtime_ns == src_stat.st_mtime_ns:
+            return False
+        if _same_contents(src.path, dest_path):
+            return False
+
+    # Copy next to the destination, then swap it in atomically
+    tmp_path = _temp_path(dest_path)
+    try:
+        shutil.copyfile(src.path, tmp_path)
+        os.utime(tmp_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        _discard_temp(tmp_path)
+        raise
+    return True
+
+
 def copy_static_css(app, _):
     # Dynamically set html_static_path if not set
     static_dirs = app.config.html_static_path
@@ -153,36 +514,62 @@ def copy_static_css(app, _):
 
     # Find the resources directory in the extension package
     try:
-        import pkg_resources
+        from importlib.resources import files
 
-        resources_dir = pkg_resources.resource_filename(
-            "spac_kit.autodocs", "resources"
-        )
-    except Exception:
+        resources_dir = str(files("spac_kit.autodocs").joinpath("resources"))
+    except ModuleNotFoundError:
         resources_dir = os.path.join(os.path.dirname(__file__), "resources")
 
     if not os.path.isdir(resources_dir):
         logger.warning(
-            f"[spacdocs] Could not find resources directory to copy: {resources_dir}"
+            "[spacdocs] Could not find resources directory to copy: %s", resources_dir
         )
         return
 
-    for fname in os.listdir(resources_dir):
-        src_path = os.path.join(resources_dir, fname)
+    resources = _list_files(resources_dir)
+    existing = _list_files(static_dir)
+
+    for fname, entry in resources.items():
         dest_path = os.path.join(static_dir, fname)
-        if os.path.isfile(src_path):
-            need_copy = True
-            if os.path.exists(dest_path):
-                with open(src_path, "rb") as f1, open(dest_path, "rb") as f2:
-                    if f1.read() == f2.read():
-                        need_copy = False
+        if _copy_if_changed(entry, dest_path, existing.get(fname)):
+            logger.info("[spacdocs] Copied %s to %s", fname, dest_path)
+
+
+# --- Directive ---
+# Raw HTML for the info icon and tooltip next to a described field's name;
+# the only substitution is the already-escaped description.
+_TOOLTIP_TMPL = (
+    '<span class="field-name-tooltip" style="margin-left:0.4em; vertical-align:middle; display:inline-block; cursor:pointer;">'
+    '<img src="/_static/circle-info.svg" alt="info" style="width:1em;height:1em;vertical-align:middle;display:inline-block;">'
+    '<span class="tooltiptext">%s</span>'
+    "</span>"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_packet(packet_obj_name):
+    """Resolve a dotted path to a packet instance, or None if it is not a packet.
+
+    Packets are module-level definitions, so the result is cached for the
+    lifetime of the process rather than resolved again by every directive.
+    """
+    from ccsdspy.packet_types import _BasePacket
 
-            if need_copy:
-                shutil.copyfile(src_path, dest_path)
-                logger.info(f"[spacdocs] Copied {fname} to {dest_path}")
+    module_name, var_name = packet_obj_name.rsplit(".", 1)
+    module = _cached_import(module_name)
+    packet = getattr(module, var_name, None)
+    if not isinstance(packet, _BasePacket):
+        return None
+    return packet
 
 
-class SpacDocsDirective(ObjectDescription):
+class _SpacDocsDirectiveMixin:
+    """Implementation of the ``spacdocs`` directive, see ``SpacDocsDirective``.
+
+    The docutils ``nodes`` and Sphinx ``addnodes`` modules are bound to the
+    directive class as ``_nodes`` and ``_addnodes`` when it is built.
+    """
+
     _Column = namedtuple("_Column", ["colname", "attr", "show_on_summary"])
 
     # Column definitions for all field attributes
@@ -197,31 +584,58 @@ class SpacDocsDirective(ObjectDescription):
         _Column("ArrayOrder", "_array_order", False),
     ]
 
+    # Columns shown in the summary table and in each field's detail table
+    # (where Name is the title), resolved once instead of filtered per field
+    _SUMMARY_COLUMNS = tuple(col for col in ALL_COLUMNS if col.show_on_summary)
+    _DETAIL_COLUMNS = tuple(
+        col for col in ALL_COLUMNS if col.attr not in ("_name", "_field_type")
+    )
+    # Detail columns for fields that are not arrays
+    _DETAIL_COLUMNS_SCALAR = tuple(
+        col
+        for col in _DETAIL_COLUMNS
+        if col.attr not in ("_array_shape", "_array_order")
+    )
+
+    # Every column attribute of a field, fetched with a single call per field
+    _COLUMN_ATTRS = tuple(col.attr for col in ALL_COLUMNS)
+    _get_column_attrs = staticmethod(operator.attrgetter(*_COLUMN_ATTRS))
+
     def _load_packet(self, packet_obj_name):
         """Load a packet instance from a module path."""
-        module_name, var_name = packet_obj_name.rsplit(".", 1)
-        module = importlib.import_module(module_name)
-        packet = getattr(module, var_name, None)
-        if not isinstance(packet, _BasePacket):
-            return None
-        return packet
+        return _resolve_packet(packet_obj_name)
 
-    def _calculate_bit_offset(self, field, running_offset):
+    def _field_values(self, field):
+        """Fetch a field's column attributes and description, keyed by attribute."""
+        try:
+            values = dict(zip(self._COLUMN_ATTRS, self._get_column_attrs(field)))
+        except AttributeError:
+            # Not a complete PacketField; look each attribute up with a default
+            values = {
+                attr: getattr(field, attr, "" if attr == "_name" else None)
+                for attr in self._COLUMN_ATTRS
+            }
+        values["_description"] = getattr(field, "_description", None)
+        return values
+
+    # The formatters below take a field's ``values`` (see _field_values)
+
+    def _calculate_bit_offset(self, values, running_offset):
         """Calculate the bit offset for a field, using running offset if not explicitly set."""
-        value = getattr(field, "_bit_offset", None)
+        value = values["_bit_offset"]
         if value is None or value == "":
             return running_offset
         return value
 
-    def _format_bit_offset(self, field, running_offset):
+    def _format_bit_offset(self, values, running_offset):
         """Format the bit offset, using running offset if not explicitly set."""
-        value = self._calculate_bit_offset(field, running_offset)
+        value = self._calculate_bit_offset(values, running_offset)
         return str(value)
 
-    def _format_data_type(self, field):
+    def _format_data_type(self, values):
         """Format the data type with array notation if applicable."""
-        data_type = getattr(field, "_data_type", None)
-        array_shape = getattr(field, "_array_shape", None)
+        data_type = values["_data_type"]
+        array_shape = values["_array_shape"]
 
         if array_shape == "expand":
             return f"{str(data_type)}[]"
@@ -230,83 +644,99 @@ class SpacDocsDirective(ObjectDescription):
         else:
             return str(data_type)
 
-    def _format_field_value(self, field, attr):
+    def _format_field_value(self, values, attr):
         """Format a generic field attribute value for display."""
-        value = getattr(field, attr, "")
+        value = values.get(attr)
         if value is None:
             return ""
         return str(value)
 
-    def _get_formatted_value(self, field, attr, running_offset):
+    def _get_formatted_value(self, values, attr, running_offset):
         """Route to the appropriate formatter based on the attribute."""
         if attr == "_data_type":
-            return self._format_data_type(field)
+            return self._format_data_type(values)
         elif attr == "_bit_offset":
-            return self._format_bit_offset(field, running_offset)
+            return self._format_bit_offset(values, running_offset)
         else:
-            return self._format_field_value(field, attr)
+            return self._format_field_value(values, attr)
+
+    def _detail_columns(self, values):
+        """Return the detail section columns for a field's ``values``."""
+        if values["_array_shape"] is not None:
+            return self._DETAIL_COLUMNS
+        return self._DETAIL_COLUMNS_SCALAR
+
+    def _format_values(self, values, running_offset, columns):
+        """Format the given columns of a field's ``values``, keyed by attribute."""
+        return {
+            column.attr: self._get_formatted_value(values, column.attr, running_offset)
+            for column in columns
+        }
 
     def _create_name_entry_with_tooltip(self, field_name, description):
         """Create a table entry for the Name column with an optional tooltip."""
+        nodes = self._nodes
+
         para = nodes.paragraph()
         ref_uri = f"#field-{field_name}"
         ref = nodes.reference("", field_name, refuri=ref_uri)
         para += ref
 
         if description:
-            safe_desc = str(description).replace('"', "&quot;").replace("'", "&#39;")
-            svg_icon = (
-                '<span class="field-name-tooltip" style="margin-left:0.4em; vertical-align:middle; display:inline-block; cursor:pointer;">'
-                '<img src="/_static/circle-info.svg" alt="info" style="width:1em;height:1em;vertical-align:middle;display:inline-block;">'
-                f'<span class="tooltiptext">{safe_desc}</span>'
-                "</span>"
-            )
-            para += nodes.raw("", svg_icon, format="html")
+            safe_desc = html.escape(str(description), quote=True)
+            para += nodes.raw("", _TOOLTIP_TMPL % safe_desc, format="html")
 
         return para
 
-    def _create_summary_table_row(self, field, running_offset):
+    def _create_summary_table_row(
+        self, field, running_offset, values=None, formatted=None
+    ):
         """Create a single row for the summary table."""
-        row = nodes.row()
-
-        for column in self.ALL_COLUMNS:
-            # Only add entries for columns that should be shown in summary
-            if not column.show_on_summary:
-                continue
+        nodes = self._nodes
 
-            entry = nodes.entry()
+        if values is None:
+            values = self._field_values(field)
+        if formatted is None:
+            formatted = self._format_values(
+                values, running_offset, self._SUMMARY_COLUMNS
+            )
 
+        entries = []
+        for column in self._SUMMARY_COLUMNS:
             if column.attr == "_name":
-                field_name = getattr(field, column.attr, "")
-                description = getattr(field, "_description", None)
-                entry += self._create_name_entry_with_tooltip(field_name, description)
+                content = self._create_name_entry_with_tooltip(
+                    values["_name"], values["_description"]
+                )
             else:
-                value = self._get_formatted_value(field, column.attr, running_offset)
-                entry += nodes.paragraph(text=value)
+                content = nodes.paragraph(text=formatted[column.attr])
+            entries.append(nodes.entry("", content))
 
-            row += entry
-
-        return row
+        # Attach all entries at once rather than one += per cell
+        return nodes.row("", *entries)
 
     def _create_detail_section_row(self, colname, value):
         """Create a single row for a field's detail section table."""
-        section_row = nodes.row()
-        section_col_name_entry = nodes.entry()
-        section_col_value_entry = nodes.entry()
-
-        section_row += section_col_name_entry
-        section_row += section_col_value_entry
+        nodes = self._nodes
 
-        section_col_name_entry += nodes.paragraph(text=colname)
-        section_col_value_entry += nodes.paragraph(text=value)
-
-        return section_row
+        return nodes.row(
+            "",
+            nodes.entry("", nodes.paragraph(text=colname)),
+            nodes.entry("", nodes.paragraph(text=value)),
+        )
 
-    def _create_field_detail_section(self, field, running_offset):
+    def _create_field_detail_section(
+        self, field, running_offset, values=None, formatted=None
+    ):
         """Create a detailed section for a single field with all its attributes."""
-        field_name = getattr(field, "_name", "")
-        description = getattr(field, "_description", None)
-        is_array = getattr(field, "_array_shape", None) is not None
+        nodes = self._nodes
+
+        if values is None:
+            values = self._field_values(field)
+        detail_columns = self._detail_columns(values)
+        if formatted is None:
+            formatted = self._format_values(values, running_offset, detail_columns)
+        field_name = values["_name"]
+        description = values["_description"]
 
         section = nodes.section(ids=[f"field-{field_name}"])
         section += nodes.title(text=field_name)
@@ -314,41 +744,33 @@ class SpacDocsDirective(ObjectDescription):
         if description:
             section += nodes.paragraph(text=str(description))
 
-        # Create table for field attributes
-        section_table = nodes.table()
-        section_tgroup = nodes.tgroup(cols=2)
-        section_table += section_tgroup
-
-        section_tgroup += nodes.colspec(colwidth=30)
-        section_tgroup += nodes.colspec(colwidth=70)
-
-        section_thead = nodes.thead()
-        section_tgroup += section_thead
-        section_header_row = nodes.row()
-        section_thead += section_header_row
-
-        section_tbody = nodes.tbody()
-        section_tgroup += section_tbody
-
         # Add rows for each attribute (except Name, which is the title)
-        for colname, attr, _ in self.ALL_COLUMNS:
-            if attr in ["_name", "_field_type"]:
-                continue
-
-            if not is_array and attr in ["_array_shape", "_array_order"]:
-                continue
+        section_rows = [
+            self._create_detail_section_row(colname, formatted[attr])
+            for colname, attr, _ in detail_columns
+        ]
 
-            value = self._get_formatted_value(field, attr, running_offset)
-            section_row = self._create_detail_section_row(colname, value)
-            section_tbody += section_row
+        # Create table for field attributes, attaching each level's children
+        # in one call
+        section_tgroup = nodes.tgroup(cols=2)
+        section_tgroup.extend(
+            [
+                nodes.colspec(colwidth=30),
+                nodes.colspec(colwidth=70),
+                nodes.thead("", nodes.row()),
+                nodes.tbody("", *section_rows),
+            ]
+        )
+        section_table = nodes.table("", section_tgroup)
 
         section += section_table
         return section
 
     def _create_summary_table_structure(self):
         """Create the structure of the summary table (header and empty body)."""
-        # Count columns that should be shown in summary
-        summary_columns = [col for col in self.ALL_COLUMNS if col.show_on_summary]
+        nodes = self._nodes
+
+        summary_columns = self._SUMMARY_COLUMNS
         num_cols = len(summary_columns)
 
         fields_table = nodes.table()
@@ -356,19 +778,19 @@ class SpacDocsDirective(ObjectDescription):
         fields_table += tgroup
 
         # Create colspecs only for columns shown in summary
-        for _ in summary_columns:
-            tgroup += nodes.colspec(colwidth=15)
+        tgroup.extend([nodes.colspec(colwidth=15) for _ in summary_columns])
 
         # Build header row
         thead = nodes.thead()
         tgroup += thead
 
-        header_row = nodes.row()
-        for column in summary_columns:
-            entry = nodes.entry()
-            entry += nodes.paragraph(text=column.colname)
-            header_row += entry
-
+        header_row = nodes.row(
+            "",
+            *[
+                nodes.entry("", nodes.paragraph(text=column.colname))
+                for column in summary_columns
+            ],
+        )
         thead += header_row
 
         # Create empty body that will be populated
@@ -382,30 +804,45 @@ class SpacDocsDirective(ObjectDescription):
         # Create the summary table structure
         summary_table, summary_tbody = self._create_summary_table_structure()
 
-        # Lists to collect detail sections
+        # Lists to collect summary rows and detail sections, attached at once
+        summary_rows = []
         detail_sections = []
 
+        fields = packet._fields
+        field_values = [self._field_values(field) for field in fields]
+        # Each field starts where the previous ones end, unless it sets its own
+        running_offsets = itertools.accumulate(
+            (int(values["_bit_length"] or 0) for values in field_values), initial=0
+        )
+
         # Single loop through all fields
-        running_offset = 0
-        for field in packet._fields:
+        for field, values, running_offset in zip(fields, field_values, running_offsets):
+            # The detail columns cover every summary column except Name, so
+            # each value is formatted once and shared by both tables
+            formatted = self._format_values(
+                values, running_offset, self._detail_columns(values)
+            )
+
             # Create summary table row
-            summary_row = self._create_summary_table_row(field, running_offset)
-            summary_tbody += summary_row
+            summary_row = self._create_summary_table_row(
+                field, running_offset, values, formatted
+            )
+            summary_rows.append(summary_row)
 
             # Create detail section
-            detail_section = self._create_field_detail_section(field, running_offset)
+            detail_section = self._create_field_detail_section(
+                field, running_offset, values, formatted
+            )
             detail_sections.append(detail_section)
-
-            # Increment running offset by this field's bit length
-            bitlen = getattr(field, "_bit_length", 0)
-            if bitlen is None:
-                bitlen = 0
-            running_offset += int(bitlen)
+        summary_tbody.extend(summary_rows)
 
         return summary_table, detail_sections
 
     def _gen_nodes(self, packet):
         """Generate documentation nodes for a packet."""
+        nodes = self._nodes
+        addnodes = self._addnodes
+
         result = []
 
         # Create the main description node structure
@@ -433,12 +870,8 @@ class SpacDocsDirective(ObjectDescription):
                 packet
             )
 
-            # Add summary table
-            content_node += summary_table
-
-            # Add detail sections
-            for detail_section in detail_sections:
-                content_node += detail_section
+            # Add summary table followed by the detail sections
+            content_node.extend([summary_table, *detail_sections])
 
         desc_node.append(content_node)
         result.append(desc_node)
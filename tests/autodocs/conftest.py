@@ -5,9 +5,20 @@ from unittest.mock import Mock
 
 import pytest
 from ccsdspy.packet_types import _BasePacket
+from spac_kit.autodocs import _cached_import
+from spac_kit.autodocs import _resolve_packet
+from spac_kit.autodocs import _version
 from spac_kit.autodocs import SpacDocsDirective
 
 
+@pytest.fixture(autouse=True)
+def clear_autodocs_caches():
+    """Reset module-level caches so mocked modules do not leak between tests."""
+    _cached_import.cache_clear()
+    _resolve_packet.cache_clear()
+    _version.cache_clear()
+
+
 @pytest.fixture
 def mock_packet_field():
     """Create a mock PacketField with common attributes."""
@@ -8,7 +8,8 @@ class TestFormatDataType:
         """Test formatting a simple data type without arrays."""
         field = mock_packet_field(name="test", data_type="uint", bit_length=16)
 
-        result = mock_directive._format_data_type(field)
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_data_type(values)
         assert result == "uint"
 
     def test_expand_array_notation(self, mock_directive, mock_packet_field):
@@ -17,7 +18,8 @@ class TestFormatDataType:
             name="test", data_type="uint", bit_length=8, array_shape="expand"
         )
 
-        result = mock_directive._format_data_type(field)
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_data_type(values)
         assert result == "uint[]"
 
     def test_fixed_array_notation_1d(self, mock_directive, mock_packet_field):
@@ -26,7 +28,8 @@ class TestFormatDataType:
             name="test", data_type="int", bit_length=16, array_shape=(10,)
         )
 
-        result = mock_directive._format_data_type(field)
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_data_type(values)
         assert result == "int[10]"
 
     def test_fixed_array_notation_2d(self, mock_directive, mock_packet_field):
@@ -35,7 +38,8 @@ class TestFormatDataType:
             name="test", data_type="float", bit_length=32, array_shape=(3, 4)
         )
 
-        result = mock_directive._format_data_type(field)
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_data_type(values)
         assert result == "float[3,4]"
 
     def test_fixed_array_notation_3d(self, mock_directive, mock_packet_field):
@@ -44,7 +48,8 @@ class TestFormatDataType:
             name="test", data_type="uint", bit_length=8, array_shape=(2, 3, 4)
         )
 
-        result = mock_directive._format_data_type(field)
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_data_type(values)
         assert result == "uint[2,3,4]"
 
 
@@ -57,7 +62,8 @@ class TestCalculateBitOffset:
             name="test", data_type="uint", bit_length=16, bit_offset=100
         )
 
-        result = mock_directive._calculate_bit_offset(field, running_offset=50)
+        values = mock_directive._field_values(field)
+        result = mock_directive._calculate_bit_offset(values, running_offset=50)
         assert result == 100
 
     def test_running_offset_when_none(self, mock_directive, mock_packet_field):
@@ -66,7 +72,8 @@ class TestCalculateBitOffset:
             name="test", data_type="uint", bit_length=16, bit_offset=None
         )
 
-        result = mock_directive._calculate_bit_offset(field, running_offset=50)
+        values = mock_directive._field_values(field)
+        result = mock_directive._calculate_bit_offset(values, running_offset=50)
         assert result == 50
 
     def test_running_offset_when_empty_string(self, mock_directive, mock_packet_field):
@@ -75,7 +82,8 @@ class TestCalculateBitOffset:
             name="test", data_type="uint", bit_length=16, bit_offset=""
         )
 
-        result = mock_directive._calculate_bit_offset(field, running_offset=75)
+        values = mock_directive._field_values(field)
+        result = mock_directive._calculate_bit_offset(values, running_offset=75)
         assert result == 75
 
     def test_zero_offset_is_valid(self, mock_directive, mock_packet_field):
@@ -84,7 +92,8 @@ class TestCalculateBitOffset:
             name="test", data_type="uint", bit_length=16, bit_offset=0
         )
 
-        result = mock_directive._calculate_bit_offset(field, running_offset=100)
+        values = mock_directive._field_values(field)
+        result = mock_directive._calculate_bit_offset(values, running_offset=100)
         assert result == 0
 
 
@@ -97,7 +106,8 @@ class TestFormatBitOffset:
             name="test", data_type="uint", bit_length=16, bit_offset=256
         )
 
-        result = mock_directive._format_bit_offset(field, running_offset=100)
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_bit_offset(values, running_offset=100)
         assert result == "256"
 
     def test_format_running_offset(self, mock_directive, mock_packet_field):
@@ -106,7 +116,8 @@ class TestFormatBitOffset:
             name="test", data_type="uint", bit_length=16, bit_offset=None
         )
 
-        result = mock_directive._format_bit_offset(field, running_offset=128)
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_bit_offset(values, running_offset=128)
         assert result == "128"
 
 
@@ -117,14 +128,16 @@ class TestFormatFieldValue:
         """Test formatting a string attribute."""
         field = mock_packet_field(name="test", data_type="uint", byte_order="big")
 
-        result = mock_directive._format_field_value(field, "_byte_order")
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_field_value(values, "_byte_order")
         assert result == "big"
 
     def test_format_numeric_value(self, mock_directive, mock_packet_field):
         """Test formatting a numeric attribute."""
         field = mock_packet_field(name="test", data_type="uint", bit_length=32)
 
-        result = mock_directive._format_field_value(field, "_bit_length")
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_field_value(values, "_bit_length")
         assert result == "32"
 
     def test_format_none_value(self, mock_directive, mock_packet_field):
@@ -133,7 +146,8 @@ class TestFormatFieldValue:
             name="test", data_type="uint", bit_length=16, description=None
         )
 
-        result = mock_directive._format_field_value(field, "_description")
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_field_value(values, "_description")
         assert result == ""
 
     def test_format_missing_attribute(self, mock_directive):
@@ -146,8 +160,9 @@ class TestFormatFieldValue:
 
         field = SimpleField()
 
-        # The field doesn't have _nonexistent attribute, so getattr returns ""
-        result = mock_directive._format_field_value(field, "_nonexistent")
+        # The field doesn't have a _nonexistent attribute, so there is no value
+        values = mock_directive._field_values(field)
+        result = mock_directive._format_field_value(values, "_nonexistent")
         assert result == ""
 
 
@@ -160,8 +175,9 @@ class TestGetFormattedValue:
             name="test", data_type="uint", bit_length=8, array_shape="expand"
         )
 
+        values = mock_directive._field_values(field)
         result = mock_directive._get_formatted_value(
-            field, "_data_type", running_offset=0
+            values, "_data_type", running_offset=0
         )
         assert result == "uint[]"
 
@@ -171,8 +187,9 @@ class TestGetFormattedValue:
             name="test", data_type="uint", bit_length=16, bit_offset=None
         )
 
+        values = mock_directive._field_values(field)
         result = mock_directive._get_formatted_value(
-            field, "_bit_offset", running_offset=64
+            values, "_bit_offset", running_offset=64
         )
         assert result == "64"
 
@@ -180,7 +197,8 @@ class TestGetFormattedValue:
         """Test that other attributes route to generic formatter."""
         field = mock_packet_field(name="test", data_type="uint", byte_order="little")
 
+        values = mock_directive._field_values(field)
         result = mock_directive._get_formatted_value(
-            field, "_byte_order", running_offset=0
+            values, "_byte_order", running_offset=0
         )
         assert result == "little"
@@ -2,6 +2,7 @@
 
 These tests verify the end-to-end functionality of the autodocs extension.
 """
+from types import ModuleType
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -109,12 +110,11 @@ class TestEndToEndDocGeneration:
 
         # Create mock modules with packets
         def create_mock_module(modname):
-            mock_module = MagicMock()
+            mock_module = ModuleType("mock_module")
             mock_packet = Mock(spec=_BasePacket)
             mock_packet.name = f"Packet_{modname.split('.')[-1]}"
             mock_packet._fields = []
             setattr(mock_module, f"pkt_{modname.split('.')[-1]}", mock_packet)
-            mock_module.__dir__ = lambda self: [f"pkt_{modname.split('.')[-1]}"]
             return mock_module
 
         mock_import.side_effect = lambda name: create_mock_module(name)
@@ -243,10 +243,9 @@ class TestEdgeCases:
         mock_sphinx_app.config.spacdocs_packet_modules = ["test.empty_module"]
 
         # Create module with no packets
-        mock_module = MagicMock()
+        mock_module = ModuleType("mock_module")
         mock_module.some_var = "not a packet"
         mock_module.another_var = 42
-        mock_module.__dir__ = lambda self: ["some_var", "another_var"]
         mock_import.return_value = mock_module
 
         generate_packet_stubs(mock_sphinx_app)
@@ -274,13 +273,12 @@ class TestRealWorldScenarios:
 
         # Create mock modules
         def create_mission_module(modpath):
-            mock_module = MagicMock()
+            mock_module = ModuleType("mock_module")
             mock_packet = Mock(spec=_BasePacket)
             instrument = modpath.split(".")[-1]
             mock_packet.name = f"{instrument}_telemetry"
             mock_packet._fields = []
             setattr(mock_module, f"{instrument}_pkt", mock_packet)
-            mock_module.__dir__ = lambda self: [f"{instrument}_pkt"]
             return mock_module
 
         mock_import.side_effect = lambda name: create_mission_module(name)
@@ -1,4 +1,9 @@
 """Unit tests for SpacDocsDirective node generation methods."""
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ccsdspy import PacketField
 from docutils import nodes
 from sphinx import addnodes
 
@@ -42,6 +47,54 @@ class TestCreateNameEntryWithTooltip:
         raw_html = result[1].astext()
         assert "&quot;" in raw_html or "&#39;" in raw_html
 
+    def test_description_escaping_markup(self, mock_directive):
+        """Test that HTML markup in descriptions cannot leak into the page."""
+        result = mock_directive._create_name_entry_with_tooltip(
+            "field", "Temp < 5 & <script>alert(1)</script>"
+        )
+
+        raw_html = result[1].astext()
+        assert "<script>" not in raw_html
+        assert "Temp &lt; 5 &amp; &lt;script&gt;" in raw_html
+
+
+class TestFieldValues:
+    """Tests for _field_values method."""
+
+    def test_field_values_from_packet_field(self, mock_directive):
+        """Test that all column attributes are fetched from a real field."""
+        field = PacketField(name="temp", data_type="uint", bit_length=8)
+
+        values = mock_directive._field_values(field)
+
+        assert values["_name"] == "temp"
+        assert values["_data_type"] == "uint"
+        assert values["_bit_length"] == 8
+        assert values["_array_shape"] is None
+        assert values["_description"] is None
+
+    def test_formatters_read_from_values(self, mock_directive):
+        """Test that the formatters read from a field's values."""
+        values = mock_directive._field_values(
+            PacketField(name="temp", data_type="uint", bit_length=8)
+        )
+        values["_array_shape"] = (2, 3)
+
+        assert mock_directive._format_data_type(values) == "uint[2,3]"
+        assert mock_directive._format_bit_offset(values, 16) == "16"
+        assert mock_directive._format_field_value(values, "_bit_length") == "8"
+
+    def test_field_values_with_missing_attributes(self, mock_directive):
+        """Test that missing attributes fall back to their defaults."""
+        field = SimpleNamespace(_name="partial", _bit_length=4)
+
+        values = mock_directive._field_values(field)
+
+        assert values["_name"] == "partial"
+        assert values["_bit_length"] == 4
+        assert values["_data_type"] is None
+        assert values["_array_shape"] is None
+
 
 class TestCreateSummaryTableRow:
     """Tests for _create_summary_table_row method."""
@@ -244,6 +297,10 @@ class TestCreateSummaryAndDetailContent:
         ]
         assert len(tbody.children) == 3  # Three fields
 
+        # BitOffset is the fourth column; fields are 8, 16 and 32 bits long
+        offsets = [row.children[3].astext() for row in tbody.children]
+        assert offsets == ["0", "8", "24"]
+
     def test_create_content_for_array_packet(self, mock_directive, mock_array_packet):
         """Test creating content for a packet with array fields."""
         (
@@ -255,6 +312,39 @@ class TestCreateSummaryAndDetailContent:
         assert len(detail_sections) == 3
         assert all(isinstance(section, nodes.section) for section in detail_sections)
 
+    def test_formats_each_value_once(self, mock_directive, mock_simple_packet):
+        """Test that values shown in both tables are formatted only once."""
+        with patch.object(
+            mock_directive,
+            "_get_formatted_value",
+            wraps=mock_directive._get_formatted_value,
+        ) as mock_format:
+            mock_directive._create_summary_and_detail_content(mock_simple_packet)
+
+        # DataType, BitLength, BitOffset and ByteOrder for each of three fields
+        assert mock_format.call_count == 3 * 4
+
+    def test_reads_each_field_attribute_once(self, mock_directive):
+        """Test that formatting uses the fetched values, not the field again."""
+        reads = Counter()
+
+        class CountingField(PacketField):
+            def __getattribute__(self, name):
+                if name.startswith("_") and not name.startswith("__"):
+                    reads[name] += 1
+                return super().__getattribute__(name)
+
+        packet = SimpleNamespace(
+            name="P",
+            _fields=[CountingField(name="a", data_type="uint", bit_length=8)],
+        )
+
+        mock_directive._create_summary_and_detail_content(packet)
+
+        assert reads["_data_type"] == 1
+        assert reads["_bit_offset"] == 1
+        assert reads["_array_shape"] == 1
+
 
 class TestGenNodes:
     """Tests for _gen_nodes method."""
@@ -272,6 +362,11 @@ class TestGenNodes:
         assert desc_node["objtype"] == "data"
         assert desc_node["noindex"] is False
 
+    def test_node_modules_bound_to_directive(self, mock_directive):
+        """Test that the node modules are bound once on the directive class."""
+        assert type(mock_directive)._nodes is nodes
+        assert type(mock_directive)._addnodes is addnodes
+
     def test_gen_nodes_includes_packet_name(self, mock_directive, mock_simple_packet):
         """Test that generated nodes include packet name."""
         nodes_list = mock_directive._gen_nodes(mock_simple_packet)
@@ -304,3 +399,15 @@ class TestGenNodes:
 
         # Content should have children (table and sections)
         assert len(content.children) > 0
+
+    def test_gen_nodes_content_order(self, mock_directive, mock_simple_packet):
+        """Test that the summary table comes before one section per field."""
+        content = mock_directive._gen_nodes(mock_simple_packet)[0].children[1]
+
+        assert isinstance(content.children[0], nodes.table)
+        assert [section["ids"] for section in content.children[1:]] == [
+            ["field-field1"],
+            ["field-field2"],
+            ["field-field3"],
+        ]
+        assert all(child.parent is content for child in content.children)
@@ -81,6 +81,35 @@ class TestLoadPacket:
         mock_import.assert_called_once_with("ccsds.mission.instrument.subsystem")
         assert result is not None
 
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_load_packet_is_cached(self, mock_import, mock_directive):
+        """Test that repeated loads of the same packet reuse the first result."""
+        mock_module = MagicMock()
+        mock_packet = Mock(spec=_BasePacket)
+        mock_packet.name = "TestPacket"
+        mock_module.test_packet = mock_packet
+        mock_import.return_value = mock_module
+
+        first = mock_directive._load_packet("test.module.test_packet")
+        second = mock_directive._load_packet("test.module.test_packet")
+
+        # The module should only be resolved once
+        assert first is second
+        mock_import.assert_called_once_with("test.module")
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_load_packets_share_module_import(self, mock_import, mock_directive):
+        """Test that packets from the same module import it only once."""
+        mock_module = MagicMock()
+        mock_module.first_packet = Mock(spec=_BasePacket)
+        mock_module.second_packet = Mock(spec=_BasePacket)
+        mock_import.return_value = mock_module
+
+        mock_directive._load_packet("test.module.first_packet")
+        mock_directive._load_packet("test.module.second_packet")
+
+        mock_import.assert_called_once_with("test.module")
+
 
 class TestDirectiveRun:
     """Tests for the SpacDocsDirective.run method."""
@@ -199,3 +228,23 @@ class TestColumnDefinitions:
         assert "FieldType" in detail_only
         assert "ArrayShape" in detail_only
         assert "ArrayOrder" in detail_only
+
+    def test_precomputed_column_subsets(self, mock_directive):
+        """Test that the cached column subsets match ALL_COLUMNS."""
+        assert mock_directive._SUMMARY_COLUMNS == tuple(
+            col for col in mock_directive.ALL_COLUMNS if col.show_on_summary
+        )
+
+        # Name is the detail section title and FieldType is never shown there
+        detail_attrs = [col.attr for col in mock_directive._DETAIL_COLUMNS]
+        assert "_name" not in detail_attrs
+        assert "_field_type" not in detail_attrs
+        assert "_data_type" in detail_attrs
+
+        # Fields that are not arrays leave out the array columns
+        scalar_attrs = [col.attr for col in mock_directive._DETAIL_COLUMNS_SCALAR]
+        assert scalar_attrs == [
+            attr
+            for attr in detail_attrs
+            if attr not in ("_array_shape", "_array_order")
+        ]
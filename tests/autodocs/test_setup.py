@@ -1,5 +1,9 @@
 """Unit tests for Sphinx extension setup."""
+import importlib.metadata
+import subprocess
+import sys
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from spac_kit.autodocs import setup
 
@@ -19,6 +23,25 @@ class TestSetup:
         assert "parallel_read_safe" in result
         assert "parallel_write_safe" in result
 
+    def test_setup_reads_version_once(self):
+        """Test that the package metadata is only read on the first setup."""
+        with patch("importlib.metadata.version", return_value="1.2.3") as mock_version:
+            first = setup(MagicMock())
+            second = setup(MagicMock())
+
+        assert first["version"] == second["version"] == "1.2.3"
+        mock_version.assert_called_once_with("spac_kit")
+
+    def test_setup_version_when_not_installed(self):
+        """Test that a missing distribution does not break setup."""
+        with patch(
+            "importlib.metadata.version",
+            side_effect=importlib.metadata.PackageNotFoundError("spac_kit"),
+        ):
+            result = setup(MagicMock())
+
+        assert result["version"] == "unknown version"
+
     def test_setup_parallel_safe_flags(self):
         """Test that parallel processing is enabled."""
         mock_app = MagicMock()
@@ -113,3 +136,17 @@ class TestSetup:
 
         # Should have two connect calls
         assert mock_app.connect.call_count == 2
+
+    def test_import_does_not_load_sphinx(self):
+        """Test that importing the extension defers the heavy imports."""
+        code = (
+            "import sys, spac_kit.autodocs; "
+            "print(sorted(m for m in ('sphinx', 'docutils', 'ccsdspy') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        # None of the heavy dependencies should have been imported
+        assert result.stdout.strip() == "[]"
@@ -1,11 +1,54 @@
 """Unit tests for stub generation and file operations."""
-from unittest.mock import MagicMock
+import importlib
+import json
+import os
+import sys
+import threading
+from types import ModuleType
 from unittest.mock import Mock
 from unittest.mock import patch
 
+import pytest
 from ccsdspy.packet_types import _BasePacket
+from spac_kit import autodocs
+from spac_kit.autodocs import _atomic_write
+from spac_kit.autodocs import _cached_import
+from spac_kit.autodocs import _copy_if_changed
+from spac_kit.autodocs import _same_contents
 from spac_kit.autodocs import copy_static_css
 from spac_kit.autodocs import generate_packet_stubs
+from spac_kit.autodocs import logger
+
+
+def _touch_later_than(path, reference):
+    """Set the mtime of ``path`` to one second after that of ``reference``."""
+    mtime = reference.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+
+def _write_packet_package(root, name, packet_names):
+    """Write a package whose ``tlm`` module re-exports packets from ``defs``."""
+    package = root / name
+    package.mkdir(exist_ok=True)
+    (package / "__init__.py").write_text("")
+    (package / "defs.py").write_text(
+        "from ccsdspy import FixedLength, PacketField\n"
+        + "".join(
+            f"{packet} = FixedLength(\n"
+            "    [PacketField(name='a', data_type='uint', bit_length=8)]\n"
+            ")\n"
+            for packet in packet_names
+        )
+    )
+    (package / "tlm.py").write_text(f"from {name}.defs import *  # noqa\n")
+    return package
+
+
+def _forget_package(name):
+    """Drop a package and its submodules from the import caches."""
+    for modname in [m for m in sys.modules if m == name or m.startswith(f"{name}.")]:
+        del sys.modules[modname]
+    _cached_import.cache_clear()
 
 
 class TestGeneratePacketStubs:
@@ -27,12 +70,11 @@ class TestGeneratePacketStubs:
         mock_sphinx_app.config.spacdocs_packet_modules = ["test.module"]
 
         # Create a mock module with a packet
-        mock_module = MagicMock()
+        mock_module = ModuleType("mock_module")
         mock_packet = Mock(spec=_BasePacket)
         mock_packet.name = "TestPacket"
         mock_packet._fields = []
         mock_module.test_packet = mock_packet
-        mock_module.__dir__ = lambda self: ["test_packet"]
         mock_import.return_value = mock_module
 
         generate_packet_stubs(mock_sphinx_app)
@@ -54,6 +96,74 @@ class TestGeneratePacketStubs:
         assert "Failed to import" in caplog.text
         assert "nonexistent.module" in caplog.text
 
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_concurrent_imports_keep_config_order(
+        self, mock_import, mock_sphinx_app, tmp_path
+    ):
+        """Test that modules imported concurrently are processed in config order."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = [
+            "pkgs.zulu",
+            "pkgs.broken",
+            "pkgs.alpha",
+        ]
+
+        def side_effect(name):
+            if name == "pkgs.broken":
+                raise ImportError("Module not found")
+            mock_mod = ModuleType(name)
+            mock_mod.tlm = Mock(spec=_BasePacket)
+            return mock_mod
+
+        mock_import.side_effect = side_effect
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        # The failing module is skipped without affecting the others
+        content = (tmp_path / "_packet_index.rst").read_text()
+        assert "pkgs_broken" not in content
+        assert content.index("pkgs_zulu_tlm") < content.index("pkgs_alpha_tlm")
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_imports_each_package_serially(
+        self, mock_import, mock_sphinx_app, tmp_path
+    ):
+        """Test that modules sharing a top-level package share one worker."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = [
+            "pkgs.zulu",
+            "other.mod",
+            "pkgs.alpha",
+        ]
+        mock_import.side_effect = ModuleType
+
+        with patch.object(
+            autodocs, "_import_serially", wraps=autodocs._import_serially
+        ) as mock_serial:
+            generate_packet_stubs(mock_sphinx_app)
+
+        groups = sorted(call.args[0] for call in mock_serial.call_args_list)
+        assert groups == [["other.mod"], ["pkgs.zulu", "pkgs.alpha"]]
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_imports_single_package_on_calling_thread(
+        self, mock_import, mock_sphinx_app, tmp_path
+    ):
+        """Test that modules of a single package are imported without a pool."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["pkgs.zulu", "pkgs.alpha"]
+        threads = []
+
+        def import_module(name):
+            threads.append(threading.get_ident())
+            return ModuleType(name)
+
+        mock_import.side_effect = import_module
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        assert threads == [threading.get_ident()] * 2
+
     @patch("spac_kit.autodocs.importlib.import_module")
     def test_creates_stub_for_packet(self, mock_import, mock_sphinx_app, tmp_path):
         """Test that stub file is created for a packet."""
@@ -61,11 +171,10 @@ class TestGeneratePacketStubs:
         mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
 
         # Create a mock module with a packet
-        mock_module = MagicMock()
+        mock_module = ModuleType("mock_module")
         mock_packet = Mock(spec=_BasePacket)
         mock_packet.name = "TestPacket"
         mock_module.test_packet = mock_packet
-        mock_module.__dir__ = lambda self: ["test_packet"]
         mock_import.return_value = mock_module
 
         generate_packet_stubs(mock_sphinx_app)
@@ -89,11 +198,10 @@ class TestGeneratePacketStubs:
         mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
 
         # Create a mock module with a packet
-        mock_module = MagicMock()
+        mock_module = ModuleType("mock_module")
         mock_packet = Mock(spec=_BasePacket)
         mock_packet.name = "TestPacket"
         mock_module.test_packet = mock_packet
-        mock_module.__dir__ = lambda self: ["test_packet"]
         mock_import.return_value = mock_module
 
         # First generation
@@ -113,6 +221,364 @@ class TestGeneratePacketStubs:
         # File should not have been modified
         assert first_mtime == second_mtime
 
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_writes_fingerprint_index(self, mock_import, mock_sphinx_app, tmp_path):
+        """Test that a fingerprint is recorded for every stub and the toctree."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
+
+        # Create a mock module with a packet
+        mock_module = ModuleType("mock_module")
+        mock_packet = Mock(spec=_BasePacket)
+        mock_packet.name = "TestPacket"
+        mock_module.test_packet = mock_packet
+        mock_import.return_value = mock_module
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        index_file = tmp_path / "_autopackets" / ".fingerprints.json"
+        assert index_file.exists()
+
+        fingerprints = json.loads(index_file.read_text())
+        assert set(fingerprints) == {
+            "test_packets_test_packet.rst",
+            "_toctree",
+            "_modules",
+        }
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_skips_read_when_fingerprint_matches(
+        self, mock_import, mock_sphinx_app, tmp_path
+    ):
+        """Test that unchanged stubs are not read back when fingerprinted."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
+
+        # Create a mock module with a packet
+        mock_module = ModuleType("mock_module")
+        mock_packet = Mock(spec=_BasePacket)
+        mock_packet.name = "TestPacket"
+        mock_module.test_packet = mock_packet
+        mock_import.return_value = mock_module
+
+        # First generation records the fingerprints
+        generate_packet_stubs(mock_sphinx_app)
+
+        # Second generation should trust the index instead of reading stubs
+        with patch.object(os, "read") as mock_read:
+            generate_packet_stubs(mock_sphinx_app)
+
+        mock_read.assert_not_called()
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_rewrites_deleted_stub_with_fingerprint(
+        self, mock_import, mock_sphinx_app, tmp_path
+    ):
+        """Test that a fingerprinted stub is regenerated if it was deleted."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
+
+        # Create a mock module with a packet
+        mock_module = ModuleType("mock_module")
+        mock_packet = Mock(spec=_BasePacket)
+        mock_packet.name = "TestPacket"
+        mock_module.test_packet = mock_packet
+        mock_import.return_value = mock_module
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        stub_file = tmp_path / "_autopackets" / "test_packets_test_packet.rst"
+        stub_file.unlink()
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        assert stub_file.exists()
+        assert "test.packets.test_packet" in stub_file.read_text()
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_leaves_no_temporary_files(self, mock_import, mock_sphinx_app, tmp_path):
+        """Test that stubs are written atomically without leftover temp files."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
+
+        # Create a mock module with a packet
+        mock_module = ModuleType("mock_module")
+        mock_packet = Mock(spec=_BasePacket)
+        mock_packet.name = "TestPacket"
+        mock_module.test_packet = mock_packet
+        mock_import.return_value = mock_module
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        leftovers = [p.name for p in tmp_path.rglob("*") if ".tmp" in p.name]
+        assert leftovers == []
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_logs_single_summary_for_stubs(
+        self, mock_import, mock_sphinx_app, tmp_path
+    ):
+        """Test that written stubs are reported in one summary log record."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
+
+        # Create a module with several packets
+        mock_module = ModuleType("mock_module")
+        for i in range(3):
+            setattr(mock_module, f"packet_{i}", Mock(spec=_BasePacket))
+        mock_import.return_value = mock_module
+
+        with patch.object(logger, "info") as mock_info:
+            generate_packet_stubs(mock_sphinx_app)
+
+        summaries = [
+            call for call in mock_info.call_args_list if "stubs:" in call.args[0]
+        ]
+        assert len(summaries) == 1
+        assert summaries[0].args[1:3] == (3, 3)
+
+    def test_skips_when_sources_unchanged(self, mock_sphinx_app, tmp_path, monkeypatch):
+        """Test that stubs are not regenerated while packet sources are unchanged."""
+        # Create a real packet module on disk
+        module_file = tmp_path / "spacdocs_fresh_packets.py"
+        module_file.write_text(
+            "from ccsdspy import FixedLength, PacketField\n"
+            "tlm = FixedLength(\n"
+            "    [PacketField(name='a', data_type='uint', bit_length=8)]\n"
+            ")\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "spacdocs_fresh_packets", raising=False)
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_fresh_packets"]
+
+        # First generation writes the stubs and the index
+        generate_packet_stubs(mock_sphinx_app)
+        index_file = tmp_path / "docs" / "_autopackets" / ".fingerprints.json"
+        assert index_file.exists()
+
+        # Second generation should stop before touching any stub
+        with patch("spac_kit.autodocs._save_fingerprints") as mock_save:
+            generate_packet_stubs(mock_sphinx_app)
+        mock_save.assert_not_called()
+
+        # Once the source is newer than the index, stubs are checked again
+        newer = index_file.stat().st_mtime_ns + 10**9
+        os.utime(module_file, ns=(newer, newer))
+        with patch("spac_kit.autodocs._save_fingerprints") as mock_save:
+            generate_packet_stubs(mock_sphinx_app)
+        mock_save.assert_called_once()
+
+        monkeypatch.delitem(sys.modules, "spacdocs_fresh_packets", raising=False)
+
+    def test_regenerates_after_version_change(
+        self, mock_sphinx_app, tmp_path, monkeypatch
+    ):
+        """Test that stubs written by another spac_kit version are regenerated."""
+        _write_packet_package(tmp_path, "spacdocs_upgraded", ["a"])
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _forget_package("spacdocs_upgraded")
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_upgraded.tlm"]
+
+        try:
+            with patch.object(autodocs, "_version", return_value="1.0"):
+                generate_packet_stubs(mock_sphinx_app)
+            with patch.object(autodocs, "_version", return_value="2.0"):
+                with patch.object(autodocs, "_save_fingerprints") as mock_save:
+                    generate_packet_stubs(mock_sphinx_app)
+        finally:
+            _forget_package("spacdocs_upgraded")
+
+        mock_save.assert_called_once()
+
+    def test_index_records_no_source_mtimes(
+        self, mock_sphinx_app, tmp_path, monkeypatch
+    ):
+        """Test that the index in srcdir holds nothing machine-specific."""
+        _write_packet_package(tmp_path, "spacdocs_portable", ["a"])
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _forget_package("spacdocs_portable")
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_portable.tlm"]
+
+        try:
+            generate_packet_stubs(mock_sphinx_app)
+        finally:
+            _forget_package("spacdocs_portable")
+
+        index_file = tmp_path / "docs" / "_autopackets" / ".fingerprints.json"
+        assert set(json.loads(index_file.read_text())) == {
+            "spacdocs_portable_tlm_a.rst",
+            "_toctree",
+            "_modules",
+        }
+        assert str(tmp_path) not in index_file.read_text()
+
+    def test_regenerates_deleted_stub_with_unchanged_sources(
+        self, mock_sphinx_app, tmp_path, monkeypatch
+    ):
+        """Test that a deleted stub of an unchanged real module is rewritten."""
+        _write_packet_package(tmp_path, "spacdocs_deleted", ["a"])
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _forget_package("spacdocs_deleted")
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_deleted.tlm"]
+
+        try:
+            generate_packet_stubs(mock_sphinx_app)
+            stub_file = (
+                tmp_path / "docs" / "_autopackets" / "spacdocs_deleted_tlm_a.rst"
+            )
+            stub_file.unlink()
+
+            generate_packet_stubs(mock_sphinx_app)
+        finally:
+            _forget_package("spacdocs_deleted")
+
+        assert stub_file.exists()
+
+    def test_regenerates_when_reexported_source_changes(
+        self, mock_sphinx_app, tmp_path, monkeypatch
+    ):
+        """Test that a packet added to a re-exported module gets a stub."""
+        package = _write_packet_package(tmp_path, "spacdocs_reexported", ["a"])
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _forget_package("spacdocs_reexported")
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_reexported.tlm"]
+        mock_sphinx_app.env.spacdocs_cache = None
+
+        try:
+            generate_packet_stubs(mock_sphinx_app)
+
+            # Only the module defining the packets changes
+            defs_file = package / "defs.py"
+            defs_file.write_text(
+                defs_file.read_text() + "b = FixedLength(list(a._fields))\n"
+            )
+            index_file = tmp_path / "docs" / "_autopackets" / ".fingerprints.json"
+            _touch_later_than(defs_file, index_file)
+            _forget_package("spacdocs_reexported")
+
+            generate_packet_stubs(mock_sphinx_app)
+        finally:
+            _forget_package("spacdocs_reexported")
+
+        stub_dir = tmp_path / "docs" / "_autopackets"
+        assert (stub_dir / "spacdocs_reexported_tlm_b.rst").exists()
+
+    def test_reuses_env_cache_for_unchanged_modules(
+        self, mock_sphinx_app, tmp_path, monkeypatch
+    ):
+        """Test that packet discovery is cached in the env across builds."""
+        module_file = tmp_path / "spacdocs_cached_packets.py"
+        module_file.write_text(
+            "from ccsdspy import FixedLength, PacketField\n"
+            "tlm = FixedLength(\n"
+            "    [PacketField(name='a', data_type='uint', bit_length=8)]\n"
+            ")\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "spacdocs_cached_packets", raising=False)
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_cached_packets"]
+        mock_sphinx_app.env.spacdocs_cache = None
+
+        generate_packet_stubs(mock_sphinx_app)
+        cache = mock_sphinx_app.env.spacdocs_cache
+        assert cache["spacdocs_cached_packets"][1] == ["tlm"]
+
+        # Without the index the stubs are checked again, but the module is not
+        # imported since its source did not change
+        (tmp_path / "docs" / "_autopackets" / ".fingerprints.json").unlink()
+        stub_file = (
+            tmp_path / "docs" / "_autopackets" / "spacdocs_cached_packets_tlm.rst"
+        )
+        stub_file.unlink()
+        with patch("spac_kit.autodocs._safe_import") as mock_import:
+            generate_packet_stubs(mock_sphinx_app)
+        mock_import.assert_not_called()
+        assert stub_file.exists()
+
+        monkeypatch.delitem(sys.modules, "spacdocs_cached_packets", raising=False)
+
+    def test_env_cache_tracks_reexporting_package(
+        self, mock_sphinx_app, tmp_path, monkeypatch
+    ):
+        """Test that a packet added to a re-exported module is picked up."""
+        package = _write_packet_package(tmp_path, "spacdocs_reexport", ["a"])
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _forget_package("spacdocs_reexport")
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_reexport.tlm"]
+        mock_sphinx_app.env.spacdocs_cache = None
+
+        try:
+            generate_packet_stubs(mock_sphinx_app)
+            cache = mock_sphinx_app.env.spacdocs_cache
+            assert str(package / "defs.py") in cache["spacdocs_reexport.tlm"][0]
+
+            # Add a packet where it is defined, not where it is configured, and
+            # drop the index so only the env cache decides what is imported
+            defs_file = package / "defs.py"
+            defs_file.write_text(
+                defs_file.read_text() + "b = FixedLength(list(a._fields))\n"
+            )
+            _touch_later_than(defs_file, package / "tlm.py")
+            (tmp_path / "docs" / "_autopackets" / ".fingerprints.json").unlink()
+            _forget_package("spacdocs_reexport")
+
+            generate_packet_stubs(mock_sphinx_app)
+        finally:
+            _forget_package("spacdocs_reexport")
+
+        stub_dir = tmp_path / "docs" / "_autopackets"
+        assert (stub_dir / "spacdocs_reexport_tlm_b.rst").exists()
+        assert cache["spacdocs_reexport.tlm"][1] == ["a", "b"]
+
+    def test_env_cache_skips_preloaded_modules(
+        self, mock_sphinx_app, tmp_path, monkeypatch
+    ):
+        """Test that names from a module imported earlier are not cached."""
+        _write_packet_package(tmp_path, "spacdocs_preloaded", ["a"])
+        monkeypatch.syspath_prepend(str(tmp_path))
+        _forget_package("spacdocs_preloaded")
+
+        mock_sphinx_app.srcdir = str(tmp_path / "docs")
+        mock_sphinx_app.config.spacdocs_packet_modules = ["spacdocs_preloaded.tlm"]
+        mock_sphinx_app.env.spacdocs_cache = None
+
+        try:
+            importlib.import_module("spacdocs_preloaded.tlm")
+            generate_packet_stubs(mock_sphinx_app)
+        finally:
+            _forget_package("spacdocs_preloaded")
+
+        stub_dir = tmp_path / "docs" / "_autopackets"
+        assert (stub_dir / "spacdocs_preloaded_tlm_a.rst").exists()
+        assert "spacdocs_preloaded.tlm" not in mock_sphinx_app.env.spacdocs_cache
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_failed_import_is_not_recorded_as_complete(
+        self, mock_import, mock_sphinx_app, tmp_path
+    ):
+        """Test that a run with import failures cannot be skipped next time."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
+        mock_import.side_effect = ImportError("Module not found")
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        index_file = tmp_path / "_autopackets" / ".fingerprints.json"
+        assert "_modules" not in json.loads(index_file.read_text())
+
     @patch("spac_kit.autodocs.importlib.import_module")
     def test_creates_toctree_file(self, mock_import, mock_sphinx_app, tmp_path):
         """Test that toctree index file is created."""
@@ -120,11 +586,10 @@ class TestGeneratePacketStubs:
         mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
 
         # Create a mock module with a packet
-        mock_module = MagicMock()
+        mock_module = ModuleType("mock_module")
         mock_packet = Mock(spec=_BasePacket)
         mock_packet.name = "TestPacket"
         mock_module.test_packet = mock_packet
-        mock_module.__dir__ = lambda self: ["test_packet"]
         mock_import.return_value = mock_module
 
         generate_packet_stubs(mock_sphinx_app)
@@ -149,18 +614,16 @@ class TestGeneratePacketStubs:
 
         # Create mock modules with packets
         for modpath in mock_sphinx_app.config.spacdocs_packet_modules:
-            mock_module = MagicMock()
+            mock_module = ModuleType("mock_module")
             mock_packet = Mock(spec=_BasePacket)
             mock_packet.name = f"Packet_{modpath.split('.')[-1]}"
             mock_module.test_packet = mock_packet
-            mock_module.__dir__ = lambda self: ["test_packet"]
 
             def side_effect(name):
-                mock_mod = MagicMock()
+                mock_mod = ModuleType("mock_module")
                 mock_pkt = Mock(spec=_BasePacket)
                 mock_pkt.name = f"Packet_{name.split('.')[-1]}"
                 mock_mod.test_packet = mock_pkt
-                mock_mod.__dir__ = lambda self: ["test_packet"]
                 return mock_mod
 
             mock_import.side_effect = side_effect
@@ -182,17 +645,12 @@ class TestGeneratePacketStubs:
         mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
 
         # Create a mock module with mixed attributes
-        mock_module = MagicMock()
+        mock_module = ModuleType("mock_module")
         mock_packet = Mock(spec=_BasePacket)
         mock_packet.name = "TestPacket"
         mock_module.real_packet = mock_packet
         mock_module.not_a_packet = "just a string"
         mock_module.also_not_packet = 42
-        mock_module.__dir__ = lambda self: [
-            "real_packet",
-            "not_a_packet",
-            "also_not_packet",
-        ]
         mock_import.return_value = mock_module
 
         generate_packet_stubs(mock_sphinx_app)
@@ -202,6 +660,40 @@ class TestGeneratePacketStubs:
         stub_files = list(stub_dir.glob("*.rst"))
         assert len(stub_files) == 1
 
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_lists_packets_in_name_order(self, mock_import, mock_sphinx_app, tmp_path):
+        """Test that packets are listed alphabetically, not in definition order."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["pk.tlm"]
+
+        mock_module = ModuleType("mock_module")
+        mock_module.b = Mock(spec=_BasePacket)
+        mock_module.a = Mock(spec=_BasePacket)
+        mock_import.return_value = mock_module
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        toctree = (tmp_path / "_packet_index.rst").read_text()
+        assert toctree.index("pk_tlm_a.rst") < toctree.index("pk_tlm_b.rst")
+
+    @patch("spac_kit.autodocs.importlib.import_module")
+    def test_skips_private_attributes(self, mock_import, mock_sphinx_app, tmp_path):
+        """Test that underscore-prefixed module attributes are not documented."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.spacdocs_packet_modules = ["test.packets"]
+
+        # Create a module with a public and a private packet
+        mock_module = ModuleType("mock_module")
+        mock_module.public_packet = Mock(spec=_BasePacket)
+        mock_module._private_packet = Mock(spec=_BasePacket)
+        mock_import.return_value = mock_module
+
+        generate_packet_stubs(mock_sphinx_app)
+
+        stub_dir = tmp_path / "_autopackets"
+        stub_files = [p.name for p in stub_dir.glob("*.rst")]
+        assert stub_files == ["test_packets_public_packet.rst"]
+
     @patch("spac_kit.autodocs.importlib.import_module")
     def test_handles_packet_name_matches_module(
         self, mock_import, mock_sphinx_app, tmp_path
@@ -211,11 +703,10 @@ class TestGeneratePacketStubs:
         mock_sphinx_app.config.spacdocs_packet_modules = ["ccsds.packets"]
 
         # Create a mock module where packet name matches module name
-        mock_module = MagicMock()
+        mock_module = ModuleType("mock_module")
         mock_packet = Mock(spec=_BasePacket)
         mock_packet.name = "PacketsPacket"
         mock_module.packets = mock_packet  # Attribute name matches module name
-        mock_module.__dir__ = lambda self: ["packets"]
         mock_import.return_value = mock_module
 
         generate_packet_stubs(mock_sphinx_app)
@@ -259,14 +750,14 @@ class TestCopyStaticCSS:
         static_dir = tmp_path / "_static"
         assert static_dir.exists()
 
-    @patch("pkg_resources.resource_filename")
+    @patch("importlib.resources.files")
     def test_copies_css_files(
-        self, mock_resource_filename, mock_sphinx_app, tmp_path, temp_resources_dir
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
     ):
         """Test that CSS files are copied to static directory."""
         mock_sphinx_app.srcdir = str(tmp_path)
         mock_sphinx_app.config.html_static_path = ["_static"]
-        mock_resource_filename.return_value = str(temp_resources_dir)
+        mock_files.return_value = temp_resources_dir.parent
 
         copy_static_css(mock_sphinx_app, None)
 
@@ -276,14 +767,33 @@ class TestCopyStaticCSS:
         assert css_file.exists()
         assert "color: blue" in css_file.read_text()
 
-    @patch("pkg_resources.resource_filename")
+    @patch("importlib.resources.files")
+    def test_logs_copies_lazily(
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
+    ):
+        """Test that copy messages are formatted by the logger, not eagerly."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.html_static_path = ["_static"]
+        mock_files.return_value = temp_resources_dir.parent
+
+        with patch.object(logger, "info") as mock_info:
+            copy_static_css(mock_sphinx_app, None)
+
+        copied = sorted(call.args[1] for call in mock_info.call_args_list)
+        assert copied == ["circle-info.svg", "spac-kit.css"]
+        assert all(
+            call.args[0] == "[spacdocs] Copied %s to %s"
+            for call in mock_info.call_args_list
+        )
+
+    @patch("importlib.resources.files")
     def test_copies_svg_files(
-        self, mock_resource_filename, mock_sphinx_app, tmp_path, temp_resources_dir
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
     ):
         """Test that SVG files are copied to static directory."""
         mock_sphinx_app.srcdir = str(tmp_path)
         mock_sphinx_app.config.html_static_path = ["_static"]
-        mock_resource_filename.return_value = str(temp_resources_dir)
+        mock_files.return_value = temp_resources_dir.parent
 
         copy_static_css(mock_sphinx_app, None)
 
@@ -293,14 +803,14 @@ class TestCopyStaticCSS:
         assert svg_file.exists()
         assert "svg" in svg_file.read_text()
 
-    @patch("pkg_resources.resource_filename")
+    @patch("importlib.resources.files")
     def test_does_not_overwrite_unchanged_files(
-        self, mock_resource_filename, mock_sphinx_app, tmp_path, temp_resources_dir
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
     ):
         """Test that files are not copied if content is identical."""
         mock_sphinx_app.srcdir = str(tmp_path)
         mock_sphinx_app.config.html_static_path = ["_static"]
-        mock_resource_filename.return_value = str(temp_resources_dir)
+        mock_files.return_value = temp_resources_dir.parent
 
         # First copy
         copy_static_css(mock_sphinx_app, None)
@@ -319,14 +829,14 @@ class TestCopyStaticCSS:
         # File should not have been modified
         assert first_mtime == second_mtime
 
-    @patch("pkg_resources.resource_filename")
+    @patch("importlib.resources.files")
     def test_overwrites_changed_files(
-        self, mock_resource_filename, mock_sphinx_app, tmp_path, temp_resources_dir
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
     ):
         """Test that files are overwritten if content has changed."""
         mock_sphinx_app.srcdir = str(tmp_path)
         mock_sphinx_app.config.html_static_path = ["_static"]
-        mock_resource_filename.return_value = str(temp_resources_dir)
+        mock_files.return_value = temp_resources_dir.parent
 
         # First copy
         copy_static_css(mock_sphinx_app, None)
@@ -342,6 +852,184 @@ class TestCopyStaticCSS:
         # Content should be back to original
         assert "color: blue" in css_file.read_text()
 
+    @patch("importlib.resources.files")
+    def test_overwrites_same_size_changed_files(
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
+    ):
+        """Test that files are overwritten if content changed but size did not."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.html_static_path = ["_static"]
+        mock_files.return_value = temp_resources_dir.parent
+
+        # First copy
+        copy_static_css(mock_sphinx_app, None)
+
+        # Modify the destination file without changing its size
+        static_dir = tmp_path / "_static"
+        css_file = static_dir / "spac-kit.css"
+        css_file.write_text(".test { color: gray; }")
+
+        # Second copy should overwrite
+        copy_static_css(mock_sphinx_app, None)
+
+        # Content should be back to original
+        assert "color: blue" in css_file.read_text()
+
+    @patch("importlib.resources.files")
+    def test_replaces_files_atomically(
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
+    ):
+        """Test that files are swapped into place rather than written in place."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.html_static_path = ["_static"]
+        mock_files.return_value = temp_resources_dir.parent
+
+        with patch("spac_kit.autodocs.os.replace", wraps=os.replace) as mock_replace:
+            copy_static_css(mock_sphinx_app, None)
+
+        static_dir = tmp_path / "_static"
+        replaced = {call.args[1] for call in mock_replace.call_args_list}
+        assert str(static_dir / "spac-kit.css") in replaced
+
+        # No temporary files should be left behind
+        assert sorted(p.name for p in static_dir.iterdir()) == [
+            "circle-info.svg",
+            "spac-kit.css",
+        ]
+
+    @patch("importlib.resources.files")
+    def test_copies_resource_edited_in_place(
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
+    ):
+        """Test that a resource edited in place is copied again."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.html_static_path = ["_static"]
+        mock_files.return_value = temp_resources_dir.parent
+
+        # First copy
+        copy_static_css(mock_sphinx_app, None)
+
+        # Editing a file does not move its directory's mtime
+        static_dir = tmp_path / "_static"
+        src_css = temp_resources_dir / "spac-kit.css"
+        src_css.write_text(".test { color: green; }")
+        _touch_later_than(src_css, static_dir / "spac-kit.css")
+        _touch_later_than(static_dir, temp_resources_dir)
+
+        copy_static_css(mock_sphinx_app, None)
+
+        assert "color: green" in (static_dir / "spac-kit.css").read_text()
+
+    @patch("importlib.resources.files")
+    def test_copies_keep_source_mtime(
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
+    ):
+        """Test that copies mirror the source mtime and skip the compare later."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.html_static_path = ["_static"]
+        mock_files.return_value = temp_resources_dir.parent
+
+        copy_static_css(mock_sphinx_app, None)
+
+        static_dir = tmp_path / "_static"
+        src_css = temp_resources_dir / "spac-kit.css"
+        dest_css = static_dir / "spac-kit.css"
+        assert dest_css.stat().st_mtime_ns == src_css.stat().st_mtime_ns
+
+        # Unchanged copies are not read on the next run
+        with patch("spac_kit.autodocs._same_contents") as mock_same:
+            copy_static_css(mock_sphinx_app, None)
+        mock_same.assert_not_called()
+
+    @patch("importlib.resources.files")
+    def test_copies_into_existing_newer_static_dir(
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
+    ):
+        """Test that resources are copied into a newer, non-empty static dir."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.html_static_path = ["_static"]
+        mock_files.return_value = temp_resources_dir.parent
+
+        # A user static directory created after the resources
+        static_dir = tmp_path / "_static"
+        static_dir.mkdir()
+        (static_dir / "custom.css").write_text(".mine { color: red; }")
+        _touch_later_than(static_dir, temp_resources_dir)
+
+        copy_static_css(mock_sphinx_app, None)
+
+        assert (static_dir / "spac-kit.css").exists()
+
+    @patch("importlib.resources.files")
+    def test_skips_resource_subdirectories(
+        self, mock_files, mock_sphinx_app, tmp_path, temp_resources_dir
+    ):
+        """Test that only regular files from the resources dir are copied."""
+        mock_sphinx_app.srcdir = str(tmp_path)
+        mock_sphinx_app.config.html_static_path = ["_static"]
+        mock_files.return_value = temp_resources_dir.parent
+        (temp_resources_dir / "fonts").mkdir()
+
+        copy_static_css(mock_sphinx_app, None)
+
+        static_dir = tmp_path / "_static"
+        assert sorted(p.name for p in static_dir.iterdir()) == [
+            "circle-info.svg",
+            "spac-kit.css",
+        ]
+
+    def test_same_contents_compares_chunks(self, tmp_path):
+        """Test that file comparison spans chunks and spots late differences."""
+        data = b"x" * (3 * 64 * 1024 + 5)
+        first = tmp_path / "first.bin"
+        second = tmp_path / "second.bin"
+        first.write_bytes(data)
+        second.write_bytes(data)
+        assert _same_contents(first, second)
+
+        second.write_bytes(data[:-1] + b"y")
+        assert not _same_contents(first, second)
+
+    def test_copy_if_changed(self, tmp_path):
+        """Test that a file is copied only when the destination differs."""
+        src_path = tmp_path / "style.css"
+        src_path.write_text(".a { color: blue; }")
+        dest_path = tmp_path / "static.css"
+        (src,) = [entry for entry in os.scandir(tmp_path) if entry.name == "style.css"]
+
+        assert _copy_if_changed(src, str(dest_path))
+        assert dest_path.read_text() == ".a { color: blue; }"
+
+        (dest,) = [
+            entry for entry in os.scandir(tmp_path) if entry.name == "static.css"
+        ]
+        assert not _copy_if_changed(src, str(dest_path), dest)
+
+    def test_failed_copy_leaves_no_temp_file(self, tmp_path):
+        """Test that a copy failing before the swap removes its temporary file."""
+        src_path = tmp_path / "style.css"
+        src_path.write_text(".a { color: blue; }")
+        dest_path = tmp_path / "static.css"
+        (src,) = list(os.scandir(tmp_path))
+
+        with patch.object(os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _copy_if_changed(src, str(dest_path))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["style.css"]
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        """Test that a write failing before the swap removes its temporary file."""
+        path = tmp_path / "index.json"
+
+        with patch.object(os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _atomic_write(str(path), b"{}")
+
+        assert list(tmp_path.iterdir()) == []
+        _atomic_write(str(path), b"{}")
+        assert path.read_bytes() == b"{}"
+
     def test_handles_missing_resources_directory(
         self, mock_sphinx_app, tmp_path, caplog
     ):
@@ -350,8 +1038,8 @@ class TestCopyStaticCSS:
         mock_sphinx_app.config.html_static_path = ["_static"]
 
         with patch(
-            "pkg_resources.resource_filename",
-            return_value="/nonexistent/path",
+            "importlib.resources.files",
+            return_value=tmp_path / "nonexistent",
         ):
             copy_static_css(mock_sphinx_app, None)
 
@@ -361,14 +1049,14 @@ class TestCopyStaticCSS:
     def test_fallback_to_local_resources_directory(
         self, mock_sphinx_app, tmp_path, temp_resources_dir
     ):
-        """Test fallback to local resources directory when pkg_resources fails."""
+        """Test fallback to local resources directory when the package lookup fails."""
         mock_sphinx_app.srcdir = str(tmp_path)
         mock_sphinx_app.config.html_static_path = ["_static"]
 
-        # Mock pkg_resources to raise exception
+        # Mock importlib.resources to fail to resolve the package
         with patch(
-            "pkg_resources.resource_filename",
-            side_effect=Exception("pkg_resources failed"),
+            "importlib.resources.files",
+            side_effect=ModuleNotFoundError("spac_kit.autodocs"),
         ):
             # Mock os.path.dirname to return our temp resources parent
             with patch(
@@ -376,6 +1064,9 @@ class TestCopyStaticCSS:
                 return_value=str(temp_resources_dir.parent),
             ):
                 with patch("spac_kit.autodocs.os.path.isdir", return_value=True):
-                    with patch("spac_kit.autodocs.os.listdir", return_value=[]):
+                    with patch("spac_kit.autodocs.os.scandir") as mock_scandir:
+                        mock_scandir.return_value.__enter__.return_value = []
                         # Should not raise, uses fallback
                         copy_static_css(mock_sphinx_app, None)
+
+                    mock_scandir.assert_any_call(str(temp_resources_dir))